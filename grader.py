@@ -3,26 +3,518 @@
 
 import requests
 import json
+import os
+import re
+import time
+import hashlib
+import threading
+from collections import Counter
+from functools import partial
+from pathlib import Path
 import pandas as pd
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson은 64비트를 넘는 정수를 float로 바꾸므로, 20자리 이상 숫자가 있으면 표준 json 사용
+_LONG_DIGITS = re.compile(rb"\d{20,}")
+
+def _json_loads(data: bytes) -> Any:
+    """정답 파일 파싱 (가능하면 orjson, 결과가 달라질 수 있으면 표준 json)"""
+    if orjson is not None and not _LONG_DIGITS.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity 등 표준 json만 읽을 수 있는 값
+            pass
+    # 표준 json도 UTF-8 bytes를 바로 받을 수 있음
+    return json.loads(data)
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# 제출할 때마다 TCP/TLS 연결을 새로 맺지 않도록 세션을 재사용
+_session = requests.Session()
+
+def _as_array(values: Any) -> np.ndarray:
+    """Series/배열 답안을 복사 없이 numpy 배열로 변환"""
+    if hasattr(values, 'to_numpy'):
+        return values.to_numpy()
+    return np.asarray(values)
+
+def _numeric_close(a, b, atol, rtol):
+    """abs(a-b) <= max(rtol * max(|a|, |b|), atol)"""
+    return abs(a - b) <= max(rtol * max(abs(a), abs(b)), atol)
+
+if _HAS_NUMBA:
+    # exec 등으로 파일 없이 로드되면 디스크 캐시를 쓸 수 없으므로 끔
+    _numeric_close = njit(cache="__file__" in globals())(_numeric_close)
+
+# numeric 답안으로 인정하는 타입 (numpy 스칼라 포함, isinstance 한 번으로 검사)
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+_INTEGER_TYPES = (int, np.integer)
+
+def _warmup_jit():
+    """첫 채점에서 JIT 컴파일 지연이 생기지 않도록 float64로 미리 컴파일"""
+    _numeric_close(0.0, 0.0, 1e-9, 1e-9)
+
+def _expected_array(values: Any) -> Optional[np.ndarray]:
+    """정답 값을 비교용 numpy 배열로 변환 (변환할 수 없으면 None)"""
+    try:
+        arr = np.asarray(values)
+        if arr.tolist() == values:
+            return arr
+    except (TypeError, ValueError):
+        pass
+    # 섞인 타입([1, "a"] -> 문자열로 바뀜)이나 길이가 다른 중첩 리스트는 원래 값 그대로 object 배열로
+    try:
+        return np.array(values, dtype=object)
+    except (TypeError, ValueError):
+        return None
+
+def _is_object_rows(student_arr: np.ndarray, expected_arr: np.ndarray) -> bool:
+    """학생 답안이 리스트를 원소로 갖는 1차원 object 배열인지 (예: Series.str.split())"""
+    return student_arr.dtype == object and student_arr.ndim == 1 and expected_arr.ndim > 1
+
+def _values_equal(student_answer: Any, expected_arr: Optional[np.ndarray], expected_values: Any,
+                  cast_to_student: bool = True) -> bool:
+    """배열/Series 답안의 값 비교 (기존 리스트 비교와 같은 결과를 C 수준에서 계산)"""
+    student_arr = _as_array(student_answer)
+    if expected_arr is None or _is_object_rows(student_arr, expected_arr):
+        return student_arr.tolist() == expected_values
+    if student_arr.shape != expected_arr.shape:
+        return False
+    # Series 원소(np.float32)와 파이썬 float 비교는 float32 기준이므로 정답도 학생 dtype으로 맞춤
+    # (0.1 vs float32(0.1)). tolist()로 비교하던 array_values는 cast_to_student=False로 엄격하게 비교
+    if (cast_to_student and student_arr.dtype.kind in "fc" and expected_arr.dtype.kind in "biuf"
+            and student_arr.dtype != expected_arr.dtype):
+        expected_arr = expected_arr.astype(student_arr.dtype)
+    return bool(np.array_equal(student_arr, expected_arr))
+
+def _strict_answer_df(expected: Any) -> Optional[pd.DataFrame]:
+    """to_dict() == expected 와 결과가 같을 때만 비교용 DataFrame을 생성 (아니면 None)"""
+    # {열: {행: 값}} 형태이고 모든 열의 행 키가 같으며 None/NaN이 없어야 함
+    # (DataFrame.equals는 dict-of-lists 정답이나 None/NaN 자리도 같다고 봄)
+    if not expected or not all(isinstance(column, dict) for column in expected.values()):
+        return None
+    columns = list(expected.values())
+    row_keys = set(columns[0])
+    for column in columns:
+        if set(column) != row_keys:
+            return None
+        for value in column.values():
+            if value is None or (isinstance(value, float) and value != value):
+                return None
+    try:
+        return pd.DataFrame(expected)
+    except (TypeError, ValueError):
+        return None
+
+def _frames_equal_by_label(student: pd.DataFrame, expected_df: pd.DataFrame, expected: dict) -> bool:
+    """to_dict() == expected 와 같은 기준(라벨별 값 비교, dtype 무관)을 dict 생성 없이 계산"""
+    if not (student.columns.is_unique and student.index.is_unique):
+        # 라벨이 중복되면 to_dict의 덮어쓰기 동작을 그대로 따름
+        return student.to_dict() == expected
+    if set(student.columns) != set(expected_df.columns) or set(student.index) != set(expected_df.index):
+        return False
+    aligned = student.reindex(index=expected_df.index, columns=expected_df.columns)
+    return bool((aligned.to_numpy() == expected_df.to_numpy()).all())
+
+# 채점 결과 메시지 (매 채점마다 새로 만들지 않도록 모듈 상수로 둠)
+_OK = "정답입니다! 🎉"
+_WRONG = "틀렸습니다. 다시 시도해보세요."
+_NEED_NUMERIC = "숫자 형태의 답안이 필요합니다."
+_NEED_LIST = "리스트 형태의 답안이 필요합니다."
+_LIST_MISMATCH = "리스트 내용이 일치하지 않습니다."
+_LIST_LENGTH_MISMATCH = "리스트 길이가 다릅니다."
+_NEED_DATAFRAME = "DataFrame 형태의 답안이 필요합니다."
+_DATAFRAME_MISMATCH = "DataFrame이 일치하지 않습니다."
+_NEED_SERIES = "Series 형태의 답안이 필요합니다."
+_SERIES_MISMATCH = "Series의 값이 일치하지 않습니다."
+_NEED_CODE = "코드를 문자열로 제출해주세요."
+_CODE_OK = "코드 패턴이 올바릅니다! 🎉"
+_ALL_PASSED = "모든 테스트 케이스 통과! 🎉"
+_NEED_ARRAY = "numpy 배열이 필요합니다."
+_ARRAY_MISMATCH = "배열의 값이 일치하지 않습니다."
+_UNSUPPORTED = "지원하지 않는 답안 타입입니다."
+
+# ----------------------------------------------------------------------
+# 답안 타입별 비교 함수: (학생 답안, 정답 항목) -> (정답 여부, 피드백)
+# ----------------------------------------------------------------------
+
+def _cmp_exact(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    match = student_answer == correct_answer["answer"]
+    return match, _OK if match else _WRONG
+
+def _cmp_numeric(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    expected = correct_answer["answer"]
+    if not (isinstance(student_answer, _NUMERIC_TYPES) and isinstance(expected, _NUMERIC_TYPES)):
+        return False, _NEED_NUMERIC
+    
+    tolerance = correct_answer.get("tolerance", 0)
+    rtol = correct_answer.get("rtol", 0)
+    if rtol == 0 and isinstance(student_answer, _INTEGER_TYPES) and isinstance(expected, _INTEGER_TYPES):
+        # 정수끼리는 float로 바꾸면 큰 값에서 정밀도를 잃으므로 그대로 비교
+        match = abs(student_answer - expected) <= tolerance
+    else:
+        match = _numeric_close(float(student_answer), float(expected), float(tolerance), float(rtol))
+    if match:
+        return True, _OK
+    # 오차 메시지는 틀렸을 때만 만듦
+    return False, f"근사값이 맞지 않습니다. (오차: {abs(student_answer - expected):.4f})"
+
+def _cmp_list(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    expected = correct_answer["answer"]
+    if not (isinstance(student_answer, list) and isinstance(expected, list)):
+        return False, _NEED_LIST
+    
+    if len(student_answer) != len(expected):
+        return False, _LIST_LENGTH_MISMATCH
+    
+    # 순서 무관 비교: 해시 가능하면 Counter(O(N)), 아니면 정렬 비교
+    try:
+        expected_counter = correct_answer.get("_answer_counter")
+        if expected_counter is None:
+            expected_counter = Counter(expected)
+        match = Counter(student_answer) == expected_counter
+    except TypeError:
+        expected_sorted = correct_answer.get("_answer_sorted")
+        if expected_sorted is None:
+            expected_sorted = sorted(expected)
+        match = sorted(student_answer) == expected_sorted
+    return match, _OK if match else _LIST_MISMATCH
+
+def _cmp_dataframe(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    expected = correct_answer["answer"]
+    if not (isinstance(student_answer, pd.DataFrame) and isinstance(expected, dict)):
+        return False, _NEED_DATAFRAME
+    
+    expected_df = correct_answer["_answer_df"] if "_answer_df" in correct_answer else _strict_answer_df(expected)
+    if expected_df is None:
+        # 빠른 비교가 기존 기준과 달라질 수 있는 정답은 to_dict로 그대로 비교
+        match = student_answer.to_dict() == expected
+        return match, _OK if match else _DATAFRAME_MISMATCH
+    if student_answer.shape != expected_df.shape:
+        return False, f"DataFrame 형태가 일치하지 않습니다. 현재: {student_answer.shape}"
+    
+    # equals는 dtype과 열 순서까지 보므로, 실패했을 때만
+    # 기존 기준(to_dict 비교와 같은 결과)으로 다시 확인 (예: 1 vs 1.0)
+    match = student_answer.equals(expected_df) or _frames_equal_by_label(student_answer, expected_df, expected)
+    return match, _OK if match else _DATAFRAME_MISMATCH
+
+def _cmp_dataframe_numeric(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    # 숫자 DataFrame을 허용 오차 안에서 비교 (dtype 무관)
+    expected = correct_answer["answer"]
+    if not (isinstance(student_answer, pd.DataFrame) and isinstance(expected, dict)):
+        return False, _NEED_DATAFRAME
+    
+    expected_df = correct_answer.get("_answer_df")
+    if expected_df is None:
+        expected_df = pd.DataFrame(expected)
+    if student_answer.shape != expected_df.shape:
+        return False, f"DataFrame 형태가 일치하지 않습니다. 현재: {student_answer.shape}"
+    
+    rtol = correct_answer.get("_rtol")
+    if rtol is None:
+        rtol = float(correct_answer.get("rtol", 1e-5))
+    atol = correct_answer.get("_atol")
+    if atol is None:
+        atol = float(correct_answer.get("tolerance", 1e-8))
+    try:
+        pd.testing.assert_frame_equal(student_answer, expected_df, check_dtype=False, rtol=rtol, atol=atol)
+    except AssertionError:
+        # assert_frame_equal 메시지에는 정답 값이 들어 있으므로 학생 쪽 열 이름만 알려줌
+        if not (student_answer.columns.equals(expected_df.columns) and student_answer.index.equals(expected_df.index)):
+            return False, _DATAFRAME_MISMATCH
+        wrong_columns = []
+        for column in student_answer.columns:
+            try:
+                pd.testing.assert_series_equal(student_answer[column], expected_df[column], check_dtype=False, rtol=rtol, atol=atol)
+            except AssertionError:
+                wrong_columns.append(str(column))
+        if not wrong_columns:
+            return False, _DATAFRAME_MISMATCH
+        return False, f"{_DATAFRAME_MISMATCH} (값이 다른 열: {', '.join(wrong_columns)})"
+    return True, _OK
+
+def _cmp_series_dtype(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    # Series의 값과 dtype을 모두 체크
+    if not (hasattr(student_answer, 'dtype') and hasattr(student_answer, 'values')):
+        return False, _NEED_SERIES
+    
+    expected = correct_answer["answer"]
+    expected_dtype = expected["dtype"]
+    expected_values = expected["values"]
+    expected_arr = correct_answer["_answer_array"] if "_answer_array" in correct_answer else _expected_array(expected_values)
+    # 길이가 다르면 값을 꺼내 비교할 필요 없음
+    values_match = len(student_answer) == len(expected_values) and _values_equal(student_answer, expected_arr, expected_values)
+    dtype_match = str(student_answer.dtype) == expected_dtype
+    
+    if values_match and dtype_match:
+        return True, _OK
+    if not values_match:
+        return False, _SERIES_MISMATCH
+    return False, f"dtype이 일치하지 않습니다. 현재: {student_answer.dtype}, 기대값: {expected_dtype}"
+
+def _cmp_series_values(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    # Series의 값만 체크 (dtype 무관)
+    if not hasattr(student_answer, 'values'):
+        return False, _NEED_SERIES
+    
+    expected_values = correct_answer["answer"]
+    expected_arr = correct_answer["_answer_array"] if "_answer_array" in correct_answer else _expected_array(expected_values)
+    if len(student_answer) != len(expected_values):
+        return False, f"Series의 길이가 일치하지 않습니다. 현재: {len(student_answer)}"
+    
+    match = _values_equal(student_answer, expected_arr, expected_values)
+    return match, _OK if match else _SERIES_MISMATCH
+
+def _cmp_function(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    test_cases = correct_answer.get("test_cases", [])
+    passed = 0
+    total = len(test_cases)
+    
+    for test_case in test_cases:
+        try:
+            input_args = test_case["input"]
+            expected_output = test_case["output"]
+            
+            if isinstance(input_args, list):
+                actual_output = student_answer(*input_args)
+            else:
+                actual_output = student_answer(input_args)
+                
+            if actual_output == expected_output:
+                passed += 1
+        except Exception as e:
+            continue
+    
+    match = passed == total
+    if match:
+        return match, _ALL_PASSED
+    return match, f"테스트 케이스 {passed}/{total} 통과 - 다시 확인해보세요!"
+
+def _cmp_code_pattern(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    # 코드 패턴을 문자열로 체크 (matplotlib 등)
+    if not isinstance(student_answer, str):
+        return False, _NEED_CODE
+    
+    expected = correct_answer["answer"]
+    required_patterns = correct_answer.get("_required", expected.get("required", []))
+    forbidden_patterns = correct_answer.get("_forbidden", expected.get("forbidden", []))
+    
+    # 필수 패턴 체크
+    missing_patterns = [pattern for pattern in required_patterns if pattern not in student_answer]
+    
+    # 금지 패턴 체크
+    found_forbidden = [pattern for pattern in forbidden_patterns if pattern in student_answer]
+    
+    if not missing_patterns and not found_forbidden:
+        return True, _CODE_OK
+    
+    feedback_parts = []
+    if missing_patterns:
+        feedback_parts.append(f"누락된 패턴: {', '.join(missing_patterns)}")
+    if found_forbidden:
+        feedback_parts.append(f"사용하면 안 되는 패턴: {', '.join(found_forbidden)}")
+    return False, " | ".join(feedback_parts)
+
+def _cmp_array_shape(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    # numpy 배열의 형태 체크
+    if not hasattr(student_answer, 'shape'):
+        return False, _NEED_ARRAY
+    
+    expected_shape = tuple(correct_answer["answer"])
+    match = student_answer.shape == expected_shape
+    return match, _OK if match else f"배열 형태가 틀렸습니다. 현재: {student_answer.shape}, 기대값: {expected_shape}"
+
+def _cmp_array_values(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    # numpy 배열의 값 체크
+    if not hasattr(student_answer, 'tolist'):
+        return False, _NEED_ARRAY
+    
+    expected_values = correct_answer["answer"]
+    expected_arr = correct_answer["_answer_array"] if "_answer_array" in correct_answer else _expected_array(expected_values)
+    student_arr = _as_array(student_answer)
+    if expected_arr is not None and not _is_object_rows(student_arr, expected_arr):
+        expected_shape = correct_answer.get("_answer_shape", expected_arr.shape)
+        if student_arr.shape != expected_shape:
+            return False, f"배열 형태가 일치하지 않습니다. 현재: {student_arr.shape}"
+    
+    match = _values_equal(student_arr, expected_arr, expected_values, cast_to_student=False)
+    return match, _OK if match else _ARRAY_MISMATCH
+
+def _cmp_unsupported(student_answer: Any, correct_answer: Dict[str, Any]) -> Tuple[bool, str]:
+    return False, _UNSUPPORTED
+
+# 답안 타입 -> 비교 함수 (채점할 때마다 if/elif를 거치지 않도록 한 번만 구성)
+_HANDLERS = {
+    "exact": _cmp_exact,
+    "numeric": _cmp_numeric,
+    "list": _cmp_list,
+    "dataframe": _cmp_dataframe,
+    "dataframe_numeric": _cmp_dataframe_numeric,
+    "series_dtype": _cmp_series_dtype,
+    "series_values": _cmp_series_values,
+    "function": _cmp_function,
+    "code_pattern": _cmp_code_pattern,
+    "array_shape": _cmp_array_shape,
+    "array_values": _cmp_array_values,
+}
+
 class AutoGrader:
-    def __init__(self, repo_url: str, branch: str = "main"):
+    def __init__(self, repo_url: str, branch: str = "main", timeout: float = 10, ttl: float = 60,
+                 cache_dir: Optional[str] = None):
         """자동 채점 시스템 초기화"""
         self.repo_url = repo_url.rstrip('/')
         self.branch = branch
+        self.timeout = timeout
+        # 정답 파일을 서버에 다시 확인하기 전까지 그대로 사용하는 시간(초)
+        self.ttl = ttl
+        # 다른 사용자가 정답 파일을 끼워 넣을 수 없도록 사용자별 디렉터리 사용 (공용 /tmp 아님)
+        if cache_dir is None:
+            cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache"), "lab_grading")
+        self.cache_dir = Path(cache_dir)
+        # URL -> (ETag, Last-Modified, 정답 딕셔너리, 마지막 확인 시각)
+        self._cache: Dict[str, tuple] = {}
+        # 캐시와 공유 세션(_session)을 여러 스레드가 동시에 쓰지 않도록 보호
+        self._lock = threading.Lock()
+    
+    def _disk_cache_path(self, url: str) -> Path:
+        """URL에 해당하는 로컬 캐시 파일 경로"""
+        digest = hashlib.sha1(url.encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
         
-    def fetch_answer_file(self, file_path: str) -> Dict[str, Any]:
-        """Git 저장소에서 정답 파일을 가져옴"""
-        try:
-            url = f"{self.repo_url}/{file_path}"
-            response = requests.get(url)
-            response.raise_for_status()
-            return json.loads(response.text)
-        except Exception as e:
-            print(f"❌ 정답 파일을 가져오는데 실패했습니다: {e}")
-            return {}
+    def fetch_answer_file(self, file_path: str, show_error: bool = True) -> Dict[str, Any]:
+        """Git 저장소에서 정답 파일을 가져옴 (메모리 → 디스크 → 서버 순으로 확인)"""
+        # 미리 가져오기 스레드와 동시에 요청하지 않도록 한 번에 하나씩 처리
+        with self._lock:
+            try:
+                url = f"{self.repo_url}/{file_path}"
+                now = time.time()
+                cached = self._cache.get(url)
+                
+                # 1) 같은 프로세스에서 TTL 안에 다시 호출하면 메모리 캐시 사용
+                if cached is not None and now - cached[3] < self.ttl:
+                    return cached[2]
+                
+                # 2) TTL 안에 저장된 디스크 캐시가 있으면 네트워크 없이 사용
+                path = self._disk_cache_path(url)
+                try:
+                    stat = path.stat()
+                    # 현재 사용자가 만든 파일만 신뢰
+                    owned = not hasattr(os, "getuid") or stat.st_uid == os.getuid()
+                    if owned and now - stat.st_mtime < self.ttl:
+                        answers = self._normalize_answers(_json_loads(path.read_bytes()))
+                        etag, last_modified = cached[:2] if cached is not None else (None, None)
+                        self._cache[url] = (etag, last_modified, answers, now)
+                        return answers
+                except (OSError, ValueError):
+                    pass
+                
+                # 3) 서버에 재검증 요청 (ETag/Last-Modified)
+                headers = {}
+                if cached is not None:
+                    etag, last_modified = cached[:2]
+                    if etag:
+                        headers["If-None-Match"] = etag
+                    if last_modified:
+                        headers["If-Modified-Since"] = last_modified
+                
+                try:
+                    response = _session.get(url, headers=headers, timeout=self.timeout)
+                    # 304: 정답 파일이 바뀌지 않았으므로 캐시된 내용을 그대로 사용
+                    if response.status_code == 304 and cached is not None:
+                        self._cache[url] = cached[:3] + (now,)
+                        try:
+                            os.utime(path, (now, now))
+                        except OSError:
+                            pass
+                        return cached[2]
+                    response.raise_for_status()
+                except requests.RequestException:
+                    if cached is None:
+                        raise
+                    # 서버에 접속할 수 없으면 이전에 받은 정답을 계속 사용하고 TTL 뒤에 다시 시도
+                    self._cache[url] = cached[:3] + (now,)
+                    return cached[2]
+                answers = self._normalize_answers(_json_loads(response.content))
+                self._cache[url] = (
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    answers,
+                    now,
+                )
+                
+                # 다른 프로세스와 충돌하지 않도록 임시 파일에 쓴 뒤 교체
+                try:
+                    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                    tmp_path.write_bytes(response.content)
+                    os.replace(tmp_path, path)
+                except OSError:
+                    pass
+                return answers
+            except Exception as e:
+                if show_error:
+                    print(f"❌ 정답 파일을 가져오는데 실패했습니다: {e}")
+                return {}
+    
+    def _normalize_answers(self, answers: Dict[str, Any]) -> Dict[str, Any]:
+        """정답 파일을 불러올 때 한 번만 계산하면 되는 값들을 미리 준비"""
+        for entry in answers.values():
+            if not isinstance(entry, dict) or "answer" not in entry:
+                continue
+            try:
+                entry.update(self._precompute_entry(entry))
+            except Exception:
+                # 형식이 잘못된 문제 하나 때문에 전체가 실패하지 않도록 건너뜀
+                # (비교 함수는 미리 계산한 값이 없으면 직접 계산하고, 오류는 그 문제에서만 보고됨)
+                pass
+        return answers
+    
+    def _precompute_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """정답 항목 하나에 대해 미리 계산한 값들 (비공개 키)"""
+        answer_type = entry.get("type", "exact")
+        expected = entry["answer"]
+        extra = {}
+        
+        if answer_type == "list" and isinstance(expected, list):
+            try:
+                extra["_answer_counter"] = Counter(expected)
+            except TypeError:
+                pass
+            try:
+                extra["_answer_sorted"] = sorted(expected)
+            except TypeError:
+                pass
+                
+        elif answer_type == "code_pattern" and isinstance(expected, dict):
+            # 누락/금지 패턴을 보고할 때 순서가 유지되도록 tuple로 저장
+            extra["_required"] = tuple(expected.get("required", []))
+            extra["_forbidden"] = tuple(expected.get("forbidden", []))
+            
+        elif answer_type == "dataframe" and isinstance(expected, dict):
+            extra["_answer_df"] = _strict_answer_df(expected)
+            
+        elif answer_type == "dataframe_numeric" and isinstance(expected, dict):
+            extra["_answer_df"] = pd.DataFrame(expected)
+            extra["_rtol"] = float(entry.get("rtol", 1e-5))
+            extra["_atol"] = float(entry.get("tolerance", 1e-8))
+                
+        elif answer_type in ("array_values", "series_values", "series_dtype"):
+            values = expected["values"] if answer_type == "series_dtype" else expected
+            extra["_answer_array"] = _expected_array(values)
+            if answer_type == "array_values" and extra["_answer_array"] is not None:
+                extra["_answer_shape"] = extra["_answer_array"].shape
+        return extra
     
     def check_answer(self, problem_id: str, student_answer: Any, answer_file: str = "answers.json") -> Dict[str, Any]:
         """학생 답안을 채점"""
@@ -31,9 +523,27 @@ class AutoGrader:
         if problem_id not in answers:
             return {"status": "error", "message": f"문제 {problem_id}를 찾을 수 없습니다."}
         
-        correct_answer = answers[problem_id]
-        result = self._compare_answers(student_answer, correct_answer)
+        return self._result(problem_id, student_answer, answers[problem_id])
+    
+    def check_answers(self, lab_name: str, student_answers: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """여러 문제의 답안을 한 번에 채점 (정답 파일은 한 번만 가져옴)"""
+        answers = self.fetch_answer_file(f"{lab_name}/answers.json")
+        make_result = self._result
+        return [make_result(problem_id, student_answer, answers.get(problem_id))
+                for problem_id, student_answer in student_answers.items()]
+    
+    def _result(self, problem_id: str, student_answer: Any, correct_answer: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """채점 결과 딕셔너리 생성 (정답 항목이 없으면 오답 처리)"""
+        if correct_answer is None:
+            return {
+                "problem_id": problem_id,
+                "correct": False,
+                "feedback": f"문제 {problem_id}를 찾을 수 없습니다.",
+                "expected": "정답 비공개",
+                "student_answer": student_answer
+            }
         
+        result = self._compare_answers(student_answer, correct_answer)
         return {
             "problem_id": problem_id,
             "correct": result["match"],
@@ -43,154 +553,12 @@ class AutoGrader:
         }
     
     def _compare_answers(self, student_answer: Any, correct_answer: Dict[str, Any]) -> Dict[str, Any]:
-        """답안 비교 로직"""
+        """답안 비교 로직 (답안 타입에 맞는 비교 함수를 찾아 호출)"""
         answer_type = correct_answer.get("type", "exact")
-        expected = correct_answer["answer"]
-        tolerance = correct_answer.get("tolerance", 0)
+        handler = _HANDLERS.get(answer_type, _cmp_unsupported)
         
         try:
-            if answer_type == "exact":
-                match = student_answer == expected
-                feedback = "정답입니다! 🎉" if match else "틀렸습니다. 다시 시도해보세요."
-                
-            elif answer_type == "numeric":
-                if isinstance(student_answer, (int, float)) and isinstance(expected, (int, float)):
-                    diff = abs(student_answer - expected)
-                    match = diff <= tolerance
-                    feedback = "정답입니다! 🎉" if match else f"근사값이 맞지 않습니다. (오차: {diff:.4f})"
-                else:
-                    match = False
-                    feedback = "숫자 형태의 답안이 필요합니다."
-                    
-            elif answer_type == "list":
-                if isinstance(student_answer, list) and isinstance(expected, list):
-                    match = sorted(student_answer) == sorted(expected)
-                    feedback = "정답입니다! 🎉" if match else "리스트 내용이 일치하지 않습니다."
-                else:
-                    match = False
-                    feedback = "리스트 형태의 답안이 필요합니다."
-                    
-            elif answer_type == "dataframe":
-                if isinstance(student_answer, pd.DataFrame) and isinstance(expected, dict):
-                    student_dict = student_answer.to_dict()
-                    match = student_dict == expected
-                    feedback = "정답입니다! 🎉" if match else "DataFrame이 일치하지 않습니다."
-                else:
-                    match = False
-                    feedback = "DataFrame 형태의 답안이 필요합니다."
-                    
-            elif answer_type == "series_dtype":
-                # Series의 값과 dtype을 모두 체크
-                if hasattr(student_answer, 'dtype') and hasattr(student_answer, 'values'):
-                    expected_values = expected["values"]
-                    expected_dtype = expected["dtype"]
-                    
-                    values_match = list(student_answer.values) == expected_values
-                    dtype_match = str(student_answer.dtype) == expected_dtype
-                    
-                    match = values_match and dtype_match
-                    if match:
-                        feedback = "정답입니다! 🎉"
-                    elif not values_match:
-                        feedback = "Series의 값이 일치하지 않습니다."
-                    else:
-                        feedback = f"dtype이 일치하지 않습니다. 현재: {student_answer.dtype}, 기대값: {expected_dtype}"
-                else:
-                    match = False
-                    feedback = "Series 형태의 답안이 필요합니다."
-                    
-            elif answer_type == "series_values":
-                # Series의 값만 체크 (dtype 무관)
-                if hasattr(student_answer, 'values'):
-                    match = list(student_answer.values) == expected
-                    feedback = "정답입니다! 🎉" if match else "Series의 값이 일치하지 않습니다."
-                else:
-                    match = False
-                    feedback = "Series 형태의 답안이 필요합니다."
-                    
-            elif answer_type == "function":
-                test_cases = correct_answer.get("test_cases", [])
-                passed = 0
-                total = len(test_cases)
-                
-                for test_case in test_cases:
-                    try:
-                        input_args = test_case["input"]
-                        expected_output = test_case["output"]
-                        
-                        if isinstance(input_args, list):
-                            actual_output = student_answer(*input_args)
-                        else:
-                            actual_output = student_answer(input_args)
-                            
-                        if actual_output == expected_output:
-                            passed += 1
-                    except Exception as e:
-                        continue
-                
-                match = passed == total
-                if match:
-                    feedback = f"모든 테스트 케이스 통과! 🎉"
-                else:
-                    feedback = f"테스트 케이스 {passed}/{total} 통과 - 다시 확인해보세요!"
-                    
-            elif answer_type == "code_pattern":
-                # 코드 패턴을 문자열로 체크 (matplotlib 등)
-                if isinstance(student_answer, str):
-                    required_patterns = expected.get("required", [])
-                    forbidden_patterns = expected.get("forbidden", [])
-                    
-                    # 필수 패턴 체크
-                    missing_patterns = []
-                    for pattern in required_patterns:
-                        if pattern not in student_answer:
-                            missing_patterns.append(pattern)
-                    
-                    # 금지 패턴 체크  
-                    found_forbidden = []
-                    for pattern in forbidden_patterns:
-                        if pattern in student_answer:
-                            found_forbidden.append(pattern)
-                    
-                    if not missing_patterns and not found_forbidden:
-                        match = True
-                        feedback = "코드 패턴이 올바릅니다! 🎉"
-                    else:
-                        match = False
-                        feedback_parts = []
-                        if missing_patterns:
-                            feedback_parts.append(f"누락된 패턴: {', '.join(missing_patterns)}")
-                        if found_forbidden:
-                            feedback_parts.append(f"사용하면 안 되는 패턴: {', '.join(found_forbidden)}")
-                        feedback = " | ".join(feedback_parts)
-                else:
-                    match = False
-                    feedback = "코드를 문자열로 제출해주세요."
-                    
-            elif answer_type == "array_shape":
-                # numpy 배열의 형태 체크
-                if hasattr(student_answer, 'shape'):
-                    expected_shape = tuple(expected)
-                    match = student_answer.shape == expected_shape
-                    feedback = "정답입니다! 🎉" if match else f"배열 형태가 틀렸습니다. 현재: {student_answer.shape}, 기대값: {expected_shape}"
-                else:
-                    match = False
-                    feedback = "numpy 배열이 필요합니다."
-                    
-            elif answer_type == "array_values":
-                # numpy 배열의 값 체크
-                if hasattr(student_answer, 'tolist'):
-                    student_list = student_answer.tolist()
-                    match = student_list == expected
-                    feedback = "정답입니다! 🎉" if match else "배열의 값이 일치하지 않습니다."
-                else:
-                    match = False
-                    feedback = "numpy 배열이 필요합니다."
-                
-            else:
-                match = False
-                feedback = "지원하지 않는 답안 타입입니다."
-                
+            match, feedback = handler(student_answer, correct_answer)
         except Exception as e:
             match = False
             feedback = f"채점 중 오류가 발생했습니다: {str(e)}"
@@ -213,8 +581,40 @@ def submit_answer(problem_id: str, answer: Any, lab_name: str = "test1"):
     """
     answer_file = f"{lab_name}/answers.json"
     result = grader.check_answer(problem_id, answer, answer_file)
+    _print_result(result, lab_name)
+    
+    # 정답/오답 관계없이 딕셔너리 정보는 출력하지 않음
+    return ""
+
+def submit_all(lab_name: str, answers: Dict[str, Any], print_summary: bool = True):
+    """
+    여러 문제의 답안을 한 번에 제출하는 함수
+    
+    Args:
+        lab_name: 실습 이름 (예: "test1", "test2", "midterm")
+        answers: {문제 ID: 학생 답안} (예: {"problem_1": ans1, "problem_2": ans2})
+        print_summary: True이면 결과를 한 블록으로 모아서 출력
+    """
+    results = grader.check_answers(lab_name, answers)
+    
+    if not print_summary:
+        for result in results:
+            _print_result(result, lab_name)
+        return ""
     
-    # 결과 출력
+    passed = sum(1 for result in results if result['correct'])
+    print("=" * 40)
+    print(f"📝 {lab_name.upper()} - 전체 제출")
+    for result in results:
+        print(f"{'✅' if result['correct'] else '❌'} 문제 {result['problem_id']}: {result['feedback']}")
+        if not result['correct'] and result['expected'] != "정답 비공개":
+            print(f"    ✅ 정답: {result['expected']}")
+    print(f"📊 결과: {passed}/{len(results)} 정답")
+    print("=" * 40)
+    return ""
+
+def _print_result(result: Dict[str, Any], lab_name: str):
+    """채점 결과 한 건을 출력"""
     print("=" * 40)
     print(f"📝 {lab_name.upper()} - 문제 {result['problem_id']}")
     print(f"📊 결과: {'✅ 정답' if result['correct'] else '❌ 오답'}")
@@ -222,9 +622,6 @@ def submit_answer(problem_id: str, answer: Any, lab_name: str = "test1"):
     if not result['correct'] and result['expected'] != "정답 비공개":
         print(f"✅ 정답: {result['expected']}")
     print("=" * 40)
-    
-    # 정답/오답 관계없이 딕셔너리 정보는 출력하지 않음
-    return ""
 
 def create_lab_functions(lab_name: str, num_problems: int):
     """
@@ -240,17 +637,17 @@ def create_lab_functions(lab_name: str, num_problems: int):
     for i in range(1, num_problems + 1):
         problem_id = f"problem_{i}"
         
-        # 동적으로 함수 생성
-        def make_check_function(pid, lab):
-            def check_function(student_answer):
-                result = submit_answer(pid, student_answer, lab)
-                # 정답일 때는 None이 반환되므로 출력하지 않음
-                return result
-            return check_function
-        
-        # 함수를 전역 네임스페이스에 추가
+        # check_problem_i(answer) -> submit_answer(problem_id, answer, lab_name=lab_name)
         func_name = f"check_problem_{i}"
-        globals_dict[func_name] = make_check_function(problem_id, lab_name)
+        globals_dict[func_name] = partial(submit_answer, problem_id, lab_name=lab_name)
+    
+    # 학생이 문제를 푸는 동안 정답 파일을 미리 받아 두고 JIT도 컴파일해 둠
+    def prefetch():
+        # 실패하면 첫 제출 때 다시 시도하고 그때 오류를 보여줌
+        grader.fetch_answer_file(f"{lab_name}/answers.json", show_error=False)
+        _warmup_jit()
+    
+    threading.Thread(target=prefetch, daemon=True).start()
 
 # 사용법을 출력하는 함수
 def show_usage():
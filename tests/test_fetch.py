@@ -0,0 +1,169 @@
+import json
+import os
+
+import pytest
+
+import grader
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode() if payload is not None else b""
+        self.headers = headers or {}
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise grader.requests.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession:
+    """미리 정한 응답을 순서대로 돌려주고 요청 헤더를 기록"""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+    
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+ANSWERS = {"problem_1": {"type": "exact", "answer": 1}}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """grader가 보는 현재 시각을 테스트에서 앞으로 돌릴 수 있게 함"""
+    now = [grader.time.time()]
+    monkeypatch.setattr(grader.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def make_grader(tmp_path, monkeypatch):
+    def make(*responses, ttl=60):
+        session = FakeSession(*responses)
+        monkeypatch.setattr(grader, "_session", session)
+        return grader.AutoGrader("https://example.com/repo", ttl=ttl, cache_dir=tmp_path), session
+    return make
+
+
+def test_disk_cache_ignores_files_owned_by_other_users(make_grader):
+    if not hasattr(os, "geteuid") or os.geteuid() != 0:
+        pytest.skip("다른 사용자 소유 파일을 만들려면 root 권한 필요")
+    g, session = make_grader(FakeResponse(200, ANSWERS))
+    path = g._disk_cache_path("https://example.com/repo/lab/answers.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"problem_1": {"type": "exact", "answer": 999}}))
+    os.chown(path, 12345, 12345)
+    
+    assert g.fetch_answer_file("lab/answers.json") == ANSWERS
+    assert len(session.requests) == 1
+
+
+def test_default_cache_dir_is_per_user(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    g = grader.AutoGrader("https://example.com/repo")
+    assert g.cache_dir == tmp_path / "lab_grading"
+
+
+def test_network_error_after_ttl_keeps_cached_answers(make_grader, clock, capsys):
+    g, session = make_grader(FakeResponse(200, ANSWERS), FakeResponse(500), grader.requests.ConnectionError("down"))
+    assert g.fetch_answer_file("lab/answers.json") == ANSWERS
+    
+    for _ in range(2):
+        clock[0] += 61
+        assert g.fetch_answer_file("lab/answers.json") == ANSWERS
+    assert len(session.requests) == 3
+    assert "실패" not in capsys.readouterr().out
+
+
+def test_memory_cache_within_ttl(make_grader, monkeypatch):
+    g, session = make_grader(FakeResponse(200, ANSWERS))
+    assert g.fetch_answer_file("lab/answers.json") == ANSWERS
+    # 메모리 캐시만 사용하므로 디스크도 읽지 않음
+    monkeypatch.setattr(g, "_disk_cache_path", lambda url: pytest.fail("디스크 캐시를 읽으면 안 됨"))
+    assert g.fetch_answer_file("lab/answers.json") == ANSWERS
+    assert len(session.requests) == 1
+
+
+def test_disk_cache_is_written_atomically_and_shared(make_grader, tmp_path):
+    g, session = make_grader(FakeResponse(200, ANSWERS))
+    g.fetch_answer_file("lab/answers.json")
+    path = g._disk_cache_path("https://example.com/repo/lab/answers.json")
+    assert json.loads(path.read_bytes()) == ANSWERS
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+    
+    # 새 프로세스(새 인스턴스)도 TTL 안에서는 네트워크 없이 디스크 캐시 사용
+    other, other_session = make_grader()
+    assert other.fetch_answer_file("lab/answers.json") == ANSWERS
+    assert other_session.requests == []
+
+
+def test_revalidation_304_reuses_cache(make_grader, clock):
+    headers = {"ETag": '"v1"', "Last-Modified": "Wed, 14 Oct 2026 00:00:00 GMT"}
+    g, session = make_grader(FakeResponse(200, ANSWERS, headers), FakeResponse(304))
+    first = g.fetch_answer_file("lab/answers.json")
+    path = g._disk_cache_path("https://example.com/repo/lab/answers.json")
+    
+    clock[0] += 61
+    assert g.fetch_answer_file("lab/answers.json") is first
+    assert session.requests[1][1] == {"If-None-Match": '"v1"', "If-Modified-Since": headers["Last-Modified"]}
+    # 304를 받으면 디스크 캐시도 다시 신선한 상태가 됨
+    assert clock[0] - path.stat().st_mtime < g.ttl
+
+
+def test_changed_file_replaces_cache(make_grader, clock):
+    changed = {"problem_1": {"type": "exact", "answer": 2}}
+    g, session = make_grader(FakeResponse(200, ANSWERS, {"ETag": '"v1"'}), FakeResponse(200, changed, {"ETag": '"v2"'}))
+    g.fetch_answer_file("lab/answers.json")
+    
+    clock[0] += 61
+    assert g.fetch_answer_file("lab/answers.json") == changed
+    path = g._disk_cache_path("https://example.com/repo/lab/answers.json")
+    assert json.loads(path.read_bytes()) == changed
+
+
+def test_fetch_error_without_cache_returns_empty(make_grader, capsys):
+    g, session = make_grader(FakeResponse(404))
+    assert g.fetch_answer_file("lab/answers.json") == {}
+    assert "실패" in capsys.readouterr().out
+
+
+BATCH_ANSWERS = {
+    "problem_1": {"type": "exact", "answer": 1},
+    "problem_2": {"type": "list", "answer": [1, 2], "display_answer": "[1, 2]"},
+}
+
+
+def test_check_answers_fetches_once_and_reports_unknown_ids(make_grader):
+    g, session = make_grader(FakeResponse(200, BATCH_ANSWERS))
+    results = g.check_answers("lab", {"problem_1": 1, "problem_2": [3], "problem_9": 0})
+    assert len(session.requests) == 1
+    assert [r["correct"] for r in results] == [True, False, False]
+    assert results[2]["problem_id"] == "problem_9"
+    assert "찾을 수 없습니다" in results[2]["feedback"]
+    assert results[2]["expected"] == "정답 비공개"
+
+
+def test_submit_all_prints_one_summary(make_grader, monkeypatch, capsys):
+    g, session = make_grader(FakeResponse(200, BATCH_ANSWERS))
+    monkeypatch.setattr(grader, "grader", g)
+    assert grader.submit_all("lab", {"problem_1": 1, "problem_2": [3], "problem_9": 0}) == ""
+    out = capsys.readouterr().out
+    assert out.count("=" * 40) == 2
+    assert "📊 결과: 1/3 정답" in out
+    assert "✅ 정답: [1, 2]" in out
+    assert "문제 problem_9" in out
+
+
+def test_submit_all_without_summary_prints_each_result(make_grader, monkeypatch, capsys):
+    g, session = make_grader(FakeResponse(200, BATCH_ANSWERS))
+    monkeypatch.setattr(grader, "grader", g)
+    grader.submit_all("lab", {"problem_1": 1, "problem_2": [1, 2]}, print_summary=False)
+    out = capsys.readouterr().out
+    assert out.count("=" * 40) == 4
+    assert out.count("✅ 정답") == 2
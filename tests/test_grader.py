@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+
+import grader
+
+
+def grade(entry, student_answer):
+    """정답 항목을 정규화한 뒤 채점 결과(match, feedback)를 반환"""
+    answers = grader.grader._normalize_answers({"problem": dict(entry)})
+    result = grader.grader._compare_answers(student_answer, answers["problem"])
+    return result["match"], result["feedback"]
+
+
+def test_series_dtype_float32_values():
+    entry = {"type": "series_dtype", "answer": {"values": [0.1, 0.2], "dtype": "float32"}}
+    assert grade(entry, pd.Series([0.1, 0.2], dtype="float32"))[0]
+
+
+def test_series_values_float32():
+    entry = {"type": "series_values", "answer": [1.1, 2.2]}
+    assert grade(entry, pd.Series([1.1, 2.2], dtype="float32"))[0]
+
+
+def test_series_values_mixed_types():
+    entry = {"type": "series_values", "answer": [1, "a"]}
+    assert grade(entry, pd.Series([1, "a"]))[0]
+    assert not grade(entry, pd.Series(["1", "a"]))[0]
+
+
+def test_array_values_mixed_types():
+    entry = {"type": "array_values", "answer": [1, "a"]}
+    assert grade(entry, np.array([1, "a"], dtype=object))[0]
+
+
+def test_array_values_ragged():
+    entry = {"type": "array_values", "answer": [[1, 2], [3]]}
+    assert grade(entry, np.array([[1, 2], [3]], dtype=object))[0]
+    assert not grade(entry, np.array([[1, 2], [4]], dtype=object))[0]
+
+
+def test_array_values_int_does_not_match_float():
+    entry = {"type": "array_values", "answer": [1.5, 2.0]}
+    assert not grade(entry, np.array([1, 2]))[0]
+    assert grade(entry, np.array([1.5, 2.0], dtype="float32"))[0]
+
+
+def test_array_values_float32_is_strict():
+    # 기존 tolist() 비교처럼 float32(0.1) != 0.1
+    entry = {"type": "array_values", "answer": [0.1]}
+    assert grade(entry, np.array([0.1]))[0]
+    assert not grade(entry, np.array([0.1], dtype="float32"))[0]
+    assert not grade(entry, np.array([0.1], dtype="float16"))[0]
+
+
+def test_series_values_of_lists():
+    entry = {"type": "series_values", "answer": [["a", "b"], ["c", "d"]]}
+    assert grade(entry, pd.Series(["a b", "c d"]).str.split())[0]
+    assert not grade(entry, pd.Series(["a b", "c e"]).str.split())[0]
+
+
+def test_array_values_object_array_of_lists():
+    entry = {"type": "array_values", "answer": [["a", "b"], ["c", "d"]]}
+    student = np.empty(2, dtype=object)
+    student[0], student[1] = ["a", "b"], ["c", "d"]
+    assert grade(entry, student)[0]
+    assert grade(entry, np.array([["a", "b"], ["c", "d"]]))[0]
+
+
+def test_dataframe_matches_to_dict():
+    entry = {"type": "dataframe", "answer": {"a": {"x": 1, "y": 2}, "b": {"x": 3.0, "y": 4.0}}}
+    student = pd.DataFrame({"a": [1, 2], "b": [3.0, 4.0]}, index=["x", "y"])
+    assert grade(entry, student)[0]
+    # dtype/열 순서가 달라도 to_dict 기준으로는 정답
+    assert grade(entry, student[["b", "a"]].astype(float))[0]
+    assert not grade(entry, student.assign(b=[3.0, 5.0]))[0]
+
+
+def test_dataframe_null_not_equal_to_nan():
+    entry = {"type": "dataframe", "answer": {"a": {"x": 1.0, "y": None}}}
+    assert not grade(entry, pd.DataFrame({"a": [1.0, np.nan]}, index=["x", "y"]))[0]
+
+
+def test_dataframe_dict_of_lists_answer_rejected():
+    entry = {"type": "dataframe", "answer": {"a": [1, 2]}}
+    assert not grade(entry, pd.DataFrame({"a": [1, 2]}))[0]
+
+
+def test_numeric_large_integers_are_exact():
+    import math
+    
+    entry = {"type": "numeric", "answer": math.factorial(25)}
+    assert not grade(entry, math.factorial(25) + 1000)[0]
+    assert not grade({"type": "numeric", "answer": 2**53 + 1}, 2**53)[0]
+    assert grade({"type": "numeric", "answer": 10**400}, 10**400)[0]
+
+
+def test_numeric_tolerance():
+    entry = {"type": "numeric", "answer": 3.14, "tolerance": 0.01}
+    assert grade(entry, 3.141)[0]
+    assert grade(entry, np.float64(3.141))[0]
+    assert not grade(entry, 3.2)[0]
+
+
+def test_array_values_scalar():
+    entry = {"type": "array_values", "answer": 5}
+    assert grade(entry, np.int64(5))[0]
+    assert grade(entry, np.array(5))[0]
+
+
+def test_shape_mismatch_hides_expected_shape():
+    match, feedback = grade({"type": "array_values", "answer": [1, 2, 3]}, np.array([1, 2]))
+    assert not match
+    assert "(3,)" not in feedback
+    match, feedback = grade({"type": "series_values", "answer": [1, 2, 3]}, pd.Series([1, 2]))
+    assert not match
+    assert "3" not in feedback
+
+
+def test_code_pattern():
+    entry = {"type": "code_pattern", "answer": {"required": ["plt.plot", "plt"], "forbidden": ["plt.show"]}}
+    assert grade(entry, "plt.plot(x, y)")[0]
+    match, feedback = grade(entry, "plt.scatter(x, y)\nplt.show()")
+    assert not match
+    assert "plt.plot" in feedback and "plt.show" in feedback
+
+
+def test_dataframe_numeric_tolerance_and_feedback():
+    entry = {"type": "dataframe_numeric", "answer": {"a": {"0": 1.5, "1": 2.25}, "b": {"0": 1, "1": 2}}, "tolerance": 0.01}
+    expected_index = ["0", "1"]
+    assert grade(entry, pd.DataFrame({"a": [1.501, 2.25], "b": [1, 2]}, index=expected_index))[0]
+    match, feedback = grade(entry, pd.DataFrame({"a": [1.5, 2.0], "b": [1, 2]}, index=expected_index))
+    assert not match
+    assert "2.25" not in feedback
+    assert "a" in feedback and "b" not in feedback.split("열:")[1]
+
+
+def test_list_answers():
+    entry = {"type": "list", "answer": [3, 1, 2]}
+    assert grade(entry, [1, 2, 3])[0]
+    assert grade({"type": "list", "answer": [[1], [2]]}, [[2], [1]])[0]
+    assert grade(entry, [1, 2]) == (False, "리스트 길이가 다릅니다.")
+
+
+def test_json_loads_keeps_big_integers_and_nan():
+    import math
+    
+    data = ('{"problem": {"type": "numeric", "answer": %d}}' % math.factorial(25)).encode()
+    answers = grader.grader._normalize_answers(grader._json_loads(data))
+    assert answers["problem"]["answer"] == math.factorial(25)
+    assert grader.grader._compare_answers(math.factorial(25), answers["problem"])["match"]
+    assert not grader.grader._compare_answers(math.factorial(25) + 1000, answers["problem"])["match"]
+    
+    answers = grader._json_loads(b'{"problem": {"type": "exact", "answer": NaN}, "other": {"answer": 1}}')
+    assert math.isnan(answers["problem"]["answer"])
+    assert answers["other"]["answer"] == 1
+
+
+def test_malformed_entry_only_fails_its_problem():
+    answers = grader.grader._normalize_answers({
+        "bad_series": {"type": "series_dtype", "answer": [1, 2]},
+        "bad_pattern": {"type": "code_pattern", "answer": {"required": None}},
+        "good": {"type": "list", "answer": [2, 1]},
+    })
+    assert grader.grader._compare_answers([1, 2], answers["good"])["match"]
+    result = grader.grader._compare_answers(pd.Series([1, 2]), answers["bad_series"])
+    assert not result["match"] and "오류" in result["feedback"]
+    result = grader.grader._compare_answers("plt.plot()", answers["bad_pattern"])
+    assert not result["match"] and "오류" in result["feedback"]